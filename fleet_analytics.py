@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Streaming fleet analytics for the Ride Sharing System.
+Keeps top-K driver earnings and mergeable fare/distance quantile sketches
+per ride class, updated as rides are assigned, so queries never walk the fleet.
+"""
+
+import heapq
+import itertools
+import math
+
+class TopK:
+    """Heap-based top-K ranking for scores that only grow"""
+    def __init__(self, k=100):
+        if k < 1:
+            raise ValueError("TopK needs k >= 1")
+        self.k = k
+        self.members = {}
+        self.heap = []
+        self.counter = itertools.count()
+
+    def _push(self, key, score):
+        # The counter breaks score ties so keys of mixed types are never compared
+        heapq.heappush(self.heap, (score, next(self.counter), key))
+
+    def update(self, key, score):
+        """Record the new score for key, keeping only the K largest"""
+        if key in self.members or len(self.members) < self.k:
+            self.members[key] = score
+            self._push(key, score)
+        else:
+            self._drop_stale()
+            if score > self.heap[0][0]:
+                _, _, evicted = heapq.heappop(self.heap)
+                del self.members[evicted]
+                self.members[key] = score
+                self._push(key, score)
+
+        if len(self.heap) > 2 * self.k:
+            self.heap = []
+            for member, member_score in self.members.items():
+                self._push(member, member_score)
+
+    def _drop_stale(self):
+        """Pop heap entries left behind by earlier updates"""
+        while self.heap:
+            score, _, key = self.heap[0]
+            if key in self.members and self.members[key] == score:
+                break
+            heapq.heappop(self.heap)
+
+    def top(self, n=None):
+        """Return up to n (key, score) pairs, highest score first"""
+        ranked = sorted(self.members.items(), key=lambda item: item[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+class QuantileSketch:
+    """Mergeable log-bucketed quantile sketch with bounded relative error"""
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Add one non-negative observation"""
+        if value <= 0:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self.log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """Estimate the q-quantile (0 <= q <= 1), or None if empty"""
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = math.ceil(q * self.count) - 1
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def merge(self, other):
+        """Fold another sketch with the same accuracy into this one"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        return self
+
+    def to_dict(self):
+        """Serialize for sending between worker processes"""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'buckets': dict(self.buckets),
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['relative_accuracy'])
+        sketch.buckets = {int(index): count for index, count in data['buckets'].items()}
+        sketch.zero_count = data['zero_count']
+        sketch.count = data['count']
+        sketch.total = data['total']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        return sketch
+
+class FleetAnalytics:
+    """Streaming earnings rankings and fare/distance sketches per ride class"""
+    SELECTORS = {
+        'topEarners:': 'top_earners',
+        'earningsOf:': 'earnings_of',
+        'fareQuantile:': 'fare_quantile',
+        'fareQuantile:forClass:': 'fare_quantile',
+        'distanceQuantile:': 'distance_quantile',
+        'distanceQuantile:forClass:': 'distance_quantile',
+        'rideCount': 'ride_count',
+    }
+
+    def __init__(self, k=100, relative_accuracy=0.01):
+        self.k = k
+        self.relative_accuracy = relative_accuracy
+        self.earnings = {}
+        self.top_drivers = TopK(k)
+        self.fare_sketches = {}
+        self.distance_sketches = {}
+
+    def _sketch(self, sketches, ride_class):
+        if ride_class not in sketches:
+            sketches[ride_class] = QuantileSketch(self.relative_accuracy)
+        return sketches[ride_class]
+
+    def record_ride(self, driver_id, ride_class, fare, distance):
+        """Update rankings and sketches for one ride assigned to a driver"""
+        self.earnings[driver_id] = self.earnings.get(driver_id, 0) + fare
+        self.top_drivers.update(driver_id, self.earnings[driver_id])
+        self._sketch(self.fare_sketches, ride_class).add(fare)
+        self._sketch(self.distance_sketches, ride_class).add(distance)
+
+    def top_earners(self, n=None):
+        """Return the highest-earning (driverID, earnings) pairs"""
+        return self.top_drivers.top(n)
+
+    def earnings_of(self, driver_id):
+        return self.earnings.get(driver_id, 0)
+
+    def _quantile(self, sketches, q, ride_class):
+        if ride_class is not None:
+            sketch = sketches.get(ride_class)
+            return sketch.quantile(q) if sketch else None
+        combined = QuantileSketch(self.relative_accuracy)
+        for sketch in sketches.values():
+            combined.merge(sketch)
+        return combined.quantile(q)
+
+    def fare_quantile(self, q, ride_class=None):
+        """Estimate the fare q-quantile, for one ride class or across all of them"""
+        return self._quantile(self.fare_sketches, q, ride_class)
+
+    def distance_quantile(self, q, ride_class=None):
+        """Estimate the distance q-quantile, for one ride class or across all of them"""
+        return self._quantile(self.distance_sketches, q, ride_class)
+
+    def ride_count(self, ride_class=None):
+        if ride_class is not None:
+            sketch = self.fare_sketches.get(ride_class)
+            return sketch.count if sketch else 0
+        return sum(sketch.count for sketch in self.fare_sketches.values())
+
+    def merge(self, other):
+        """Fold analytics gathered by another worker into this one"""
+        for driver_id, earned in other.earnings.items():
+            self.earnings[driver_id] = self.earnings.get(driver_id, 0) + earned
+            self.top_drivers.update(driver_id, self.earnings[driver_id])
+        for ride_class, sketch in other.fare_sketches.items():
+            self._sketch(self.fare_sketches, ride_class).merge(sketch)
+        for ride_class, sketch in other.distance_sketches.items():
+            self._sketch(self.distance_sketches, ride_class).merge(sketch)
+        return self
+
+    def to_dict(self):
+        """Serialize for sending between worker processes"""
+        return {
+            'k': self.k,
+            'relative_accuracy': self.relative_accuracy,
+            'earnings': list(self.earnings.items()),
+            'fare_sketches': {name: s.to_dict() for name, s in self.fare_sketches.items()},
+            'distance_sketches': {name: s.to_dict() for name, s in self.distance_sketches.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        analytics = cls(data['k'], data['relative_accuracy'])
+        for driver_id, earned in data['earnings']:
+            analytics.earnings[driver_id] = earned
+            analytics.top_drivers.update(driver_id, earned)
+        for name, sketch in data['fare_sketches'].items():
+            analytics.fare_sketches[name] = QuantileSketch.from_dict(sketch)
+        for name, sketch in data['distance_sketches'].items():
+            analytics.distance_sketches[name] = QuantileSketch.from_dict(sketch)
+        return analytics
+
+    def send(self, selector, *args):
+        """Answer a Smalltalk message such as 'fareQuantile:forClass:'"""
+        method_name = self.SELECTORS.get(selector)
+        if not method_name:
+            raise AttributeError(f"Method '{selector}' not found in FleetAnalytics")
+        return getattr(self, method_name)(*args)
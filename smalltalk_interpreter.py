@@ -5,7 +5,152 @@ This interpreter parses and executes Smalltalk code from .st files,
 building class hierarchies and executing methods based on Smalltalk definitions.
 """
 
+import operator
+import os
 import re
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from fleet_analytics import FleetAnalytics
+
+CLASS_DEF_SOURCE = r'(\w+)\s+subclass:\s*(\w+)\s*\[(.*?)\n\]'
+CLASS_DEF_PATTERN = re.compile(CLASS_DEF_SOURCE, re.DOTALL)
+CLASS_DEF_BYTES_PATTERN = re.compile(CLASS_DEF_SOURCE.encode(), re.DOTALL)
+
+# Below this many bytes of class source, forking workers costs more than parsing in-process
+PARALLEL_PARSE_MIN_BYTES = 256 * 1024
+
+EXPRESSION_TOKEN = re.compile(
+    r'(\s*)(\d+(?:\.\d+)?(?:e-?\d+)?|\w+:|\w+|<=|>=|[-+*/<>=()])'
+)
+
+NUMBER_TYPES = (int, float)
+
+def divide(left, right):
+    """Smalltalk / : an Integer when the division is exact, otherwise a Float"""
+    if type(left) is int and type(right) is int and left % right == 0:
+        return left // right
+    return left / right
+
+PRIMITIVES = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': divide,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '=': operator.eq,
+    'max:': max,
+    'min:': min,
+}
+
+def parse_number(token):
+    """Parse a numeric literal; Integers stay Integers unless a fraction or negative exponent is given"""
+    mantissa, _, exponent = token.partition('e')
+    if '.' in mantissa or exponent.startswith('-'):
+        return float(token)
+    return int(mantissa) * 10 ** int(exponent or 0)
+
+def compile_expression(expr):
+    """Compile a unary/binary/max:/min: expression into a tree, or None if unsupported.
+    
+    Nodes are ('literal', value), ('var', name), ('self',) and
+    ('send', receiver, selector, args). Numeric literals are parsed here once.
+    Parentheses group subexpressions and a '-' written directly before a
+    number, where an operand is expected, makes a negative literal.
+    """
+    expr = expr.strip().rstrip('.').strip()
+    tokens = []
+    spaced = []
+    pos = 0
+    while pos < len(expr):
+        match = EXPRESSION_TOKEN.match(expr, pos)
+        if not match:
+            return None
+        spaced.append(bool(match.group(1)))
+        tokens.append(match.group(2))
+        pos = match.end()
+    if not tokens:
+        return None
+    
+    def is_name(token):
+        return token[0].isalpha() and not token.endswith(':')
+    
+    def parse_primary(i):
+        if i >= len(tokens):
+            return None, i
+        token = tokens[i]
+        if token == '(':
+            node, i = parse_keyword(i + 1)
+            if not node or i >= len(tokens) or tokens[i] != ')':
+                return None, i
+            return node, i + 1
+        if token == '-' and i + 1 < len(tokens) and tokens[i + 1][0].isdigit() and not spaced[i + 1]:
+            return ('literal', -parse_number(tokens[i + 1])), i + 2
+        if token[0].isdigit():
+            return ('literal', parse_number(token)), i + 1
+        if token == 'self':
+            return ('self',), i + 1
+        if is_name(token):
+            return ('var', token), i + 1
+        return None, i
+    
+    def parse_unary(i):
+        node, i = parse_primary(i)
+        while node and i < len(tokens) and is_name(tokens[i]):
+            node = ('send', node, tokens[i], ())
+            i += 1
+        return node, i
+    
+    def parse_binary(i):
+        node, i = parse_unary(i)
+        while node and i < len(tokens) and tokens[i] in PRIMITIVES and not tokens[i].endswith(':'):
+            selector = tokens[i]
+            arg, i = parse_unary(i + 1)
+            node = ('send', node, selector, (arg,)) if arg else None
+        return node, i
+    
+    def parse_keyword(i):
+        node, i = parse_binary(i)
+        if node and i < len(tokens) and tokens[i] in ('max:', 'min:'):
+            selector = tokens[i]
+            arg, i = parse_binary(i + 1)
+            node = ('send', node, selector, (arg,)) if arg else None
+        return node, i
+    
+    node, i = parse_keyword(0)
+    if i != len(tokens):
+        return None
+    return node
+
+def print_string(value):
+    """Smalltalk printString for plain Python values"""
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value is None:
+        return 'nil'
+    return str(value)
+
+def primitive_send(receiver, selector, *args):
+    """Send a message, using a Python primitive when receiver and arguments are numbers"""
+    if type(receiver) in NUMBER_TYPES and all(type(arg) in NUMBER_TYPES for arg in args):
+        if selector == 'printString':
+            return str(receiver)
+        primitive = PRIMITIVES.get(selector)
+        if primitive:
+            return primitive(receiver, *args)
+    if hasattr(receiver, 'send'):
+        return receiver.send(selector, *args)
+    if selector == 'printString':
+        return print_string(receiver)
+    method = getattr(receiver, selector.rstrip(':'), None)
+    if callable(method):
+        return method(*args)
+    raise AttributeError(f"Method '{selector}' not found in {type(receiver).__name__}")
 
 class OrderedCollection(list):
     """Smalltalk OrderedCollection"""
@@ -32,6 +177,14 @@ class SmalltalkMethod:
         self.params = params
         self.body = body
         self.klass = klass
+        self.return_expr = None
+        for line in body.split('\n'):
+            if line.strip().startswith('^'):
+                return_match = re.search(r'\^\s*(.+)', line)
+                if return_match:
+                    self.return_expr = return_match.group(1).strip()
+                    break
+        self.compiled_return = compile_expression(self.return_expr) if self.return_expr else None
 
 class SmalltalkClass:
     """Represents a Smalltalk class"""
@@ -70,27 +223,153 @@ class SmalltalkEnvironment:
     """Smalltalk execution environment"""
     def __init__(self):
         self.classes = {}
+        self.class_index = {}
+        self._loading = set()
+        self.analytics = FleetAnalytics()
         self.globals = {
             'Transcript': Transcript,
             'OrderedCollection': OrderedCollection,
+            'FleetAnalytics': self.analytics,
         }
         object_class = SmalltalkClass('Object', None)
         self.classes['Object'] = object_class
     
+    def index_directory(self, path='.', max_workers=None):
+        """Record class name -> (file, offsets, superclass) for every .st file without parsing bodies"""
+        filenames = sorted(
+            os.path.join(path, name) for name in os.listdir(path) if name.endswith('.st')
+        )
+        indexed = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for entries in pool.map(self._index_file, filenames):
+                for class_name, entry in entries:
+                    previous = indexed.get(class_name) or self.class_index.get(class_name)
+                    # Re-indexing the same file replaces its entries rather than conflicting
+                    if previous and (class_name in indexed or previous[0] != entry[0]):
+                        raise NameError(
+                            f"Class '{class_name}' defined in both {previous[0]} and {entry[0]}"
+                        )
+                    indexed[class_name] = entry
+        self.class_index.update(indexed)
+        return list(self.class_index)
+    
+    @staticmethod
+    def _index_file(filename):
+        """Scan one .st file for class definitions and their byte offsets"""
+        with open(filename, 'rb') as f:
+            code = f.read()
+        entries = []
+        for match in CLASS_DEF_BYTES_PATTERN.finditer(code):
+            class_name = match.group(2).decode()
+            superclass_name = match.group(1).decode()
+            entries.append((class_name, (filename, match.start(), match.end(), superclass_name)))
+        return entries
+    
+    @staticmethod
+    def _read_class_source(entry):
+        """Read a single class definition from its indexed file offsets"""
+        filename, start, end, _ = entry
+        with open(filename, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start).decode()
+    
+    def find_class(self, name):
+        """Find a class by name, parsing its indexed definition on first reference"""
+        klass = self.classes.get(name)
+        if klass is None and name in self.class_index:
+            if name in self._loading:
+                raise NameError(f"Class '{name}' is part of a superclass cycle")
+            self._loading.add(name)
+            try:
+                self.find_class(self.class_index[name][3])
+                klass = self.parse_class(self._read_class_source(self.class_index[name]))
+            finally:
+                self._loading.discard(name)
+        return klass
+    
+    def _resolve_superclass(self, superclass_name, class_name):
+        """Find a superclass, raising instead of leaving it None"""
+        superclass = self.find_class(superclass_name)
+        if not superclass:
+            raise NameError(f"Superclass '{superclass_name}' of '{class_name}' not found")
+        return superclass
+    
+    def load_classes(self, names, max_workers=None, min_parallel_bytes=PARALLEL_PARSE_MIN_BYTES):
+        """Parse the given classes and their superclasses as one batch.
+        
+        Batches spanning several files with at least min_parallel_bytes of
+        source are built in worker processes, one file per task.
+        """
+        pending = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in pending or name in self.classes or name not in self.class_index:
+                continue
+            pending.add(name)
+            stack.append(self.class_index[name][3])
+        
+        for name in pending:
+            chain = set()
+            current = name
+            while current in pending:
+                if current in chain:
+                    raise NameError(f"Class '{name}' is part of a superclass cycle")
+                chain.add(current)
+                current = self.class_index[current][3]
+            if current not in self.classes:
+                raise NameError(f"Superclass '{current}' of '{name}' not found")
+        
+        by_file = {}
+        for name in sorted(pending):
+            filename, start, end, _ = self.class_index[name]
+            by_file.setdefault(filename, []).append((start, end))
+        
+        source_bytes = sum(end - start for spans in by_file.values() for start, end in spans)
+        if len(by_file) > 1 and source_bytes >= min_parallel_bytes:
+            workers = min(len(by_file), max_workers or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._build_file_classes, by_file, by_file.values()))
+        else:
+            results = [self._build_file_classes(f, spans) for f, spans in by_file.items()]
+        built = [item for result in results for item in result if item[1]]
+        
+        for superclass_name, klass in built:
+            self.classes[klass.name] = klass
+        for superclass_name, klass in built:
+            klass.superclass = self.classes[superclass_name]
+        return [self.classes.get(name) for name in names]
+    
+    @staticmethod
+    def _build_file_classes(filename, spans):
+        """Build every class at the given byte offsets of one file"""
+        with open(filename, 'rb') as f:
+            code = f.read()
+        return [SmalltalkEnvironment._build_class(code[start:end].decode()) for start, end in spans]
+    
     def parse_class(self, code):
         """Parse a Smalltalk class definition"""
-        pattern = r'(\w+)\s+subclass:\s*(\w+)\s*\[(.*?)\n\]'
-        match = re.search(pattern, code, re.DOTALL)
+        superclass_name, klass = self._build_class(code)
+        if not klass:
+            return None
+        
+        klass.superclass = self._resolve_superclass(superclass_name, klass.name)
+        self.classes[klass.name] = klass
+        return klass
+    
+    @staticmethod
+    def _build_class(code):
+        """Build a class and its methods without resolving the superclass"""
+        match = CLASS_DEF_PATTERN.search(code)
         
         if not match:
-            return None
+            return None, None
         
         superclass_name = match.group(1)
         class_name = match.group(2)
         body = match.group(3)
         
-        superclass = self.classes.get(superclass_name)
-        klass = SmalltalkClass(class_name, superclass)
+        klass = SmalltalkClass(class_name)
         
         vars_match = re.search(r'\|\s*([\w\s]+)\s*\|', body)
         if vars_match:
@@ -123,12 +402,11 @@ class SmalltalkEnvironment:
             method = SmalltalkMethod(selector, params, method_body, klass)
             klass.add_method(method)
         
-        self.classes[class_name] = klass
-        return klass
+        return superclass_name, klass
     
     def create_instance(self, class_name):
         """Create an instance of a class"""
-        klass = self.classes.get(class_name)
+        klass = self.find_class(class_name)
         if not klass:
             raise NameError(f"Class '{class_name}' not found")
         
@@ -170,41 +448,24 @@ class SmalltalkEnvironment:
                 result = self.execute_method(calc_method, obj, [])
                 obj.vars['fare'] = result
         
-        if '^' in body:
-            expr = None
-            for line in body.split('\n'):
-                if line.strip().startswith('^'):
-                    return_match = re.search(r'\^\s*(.+)', line)
-                    if return_match:
-                        expr = return_match.group(1).strip()
-                        break
-            
-            if expr:
-                if expr == 'self':
-                    return obj
-                elif expr in obj.vars:
-                    return obj.vars[expr]
-                elif 'self calculateFare' in expr:
-                    calc_method = obj.klass.find_method('calculateFare')
-                    result = self.execute_method(calc_method, obj, [])
-                    obj.vars['fare'] = result
-                    return result
-                elif '*' in expr:
-                    parts = expr.split('*')
-                    left = parts[0].strip()
-                    right = float(parts[1].strip())
-                    if left in obj.vars:
-                        result = obj.vars[left] * right
-                        return result
-                    else:
-                        print(f"DEBUG: Variable '{left}' not found in {obj.vars.keys()}")
-                elif 'size' in expr or 'printString' in expr:
-                    var = expr.split()[0]
-                    if var in obj.vars:
-                        val = obj.vars[var]
-                        if hasattr(val, 'size'):
-                            return val.size()
-                        return val
+        if method.return_expr:
+            expr = method.return_expr
+            if expr == 'self':
+                return obj
+            elif expr in obj.vars:
+                return obj.vars[expr]
+            elif 'self calculateFare' in expr:
+                calc_method = obj.klass.find_method('calculateFare')
+                result = self.execute_method(calc_method, obj, [])
+                obj.vars['fare'] = result
+                return result
+            elif method.compiled_return:
+                variables = obj.vars
+                if method.params:
+                    variables = ChainMap(dict(zip(method.params, args)), obj.vars)
+                return self.evaluate(method.compiled_return, obj, variables)
+            else:
+                raise SyntaxError(f"Unsupported expression in {obj.klass.name}>>{method.selector}: ^ {expr}")
         
         if 'super rideDetails' in body:
             super_method = obj.klass.superclass.find_method('rideDetails')
@@ -239,6 +500,7 @@ class SmalltalkEnvironment:
         if 'add:' in body and len(args) > 0:
             if 'assignedRides' in obj.vars:
                 obj.vars['assignedRides'].add(args[0])
+                self.record_assignment(obj, args[0])
             elif 'requestedRides' in obj.vars:
                 obj.vars['requestedRides'].add(args[0])
         
@@ -254,6 +516,48 @@ class SmalltalkEnvironment:
         
         return None
     
+    def evaluate(self, node, receiver, variables):
+        """Evaluate a tree built by compile_expression"""
+        kind = node[0]
+        if kind == 'literal':
+            return node[1]
+        if kind == 'var':
+            name = node[1]
+            if name in variables:
+                return variables[name]
+            if name in self.globals:
+                return self.globals[name]
+            raise NameError(f"Variable '{name}' not defined")
+        if kind == 'self':
+            return receiver
+        value = self.evaluate(node[1], receiver, variables)
+        args = [self.evaluate(arg, receiver, variables) for arg in node[3]]
+        return primitive_send(value, node[2], *args)
+    
+    def record_assignment(self, driver, ride):
+        """Feed a ride assigned to a driver into the streaming fleet analytics.
+        
+        The ride is recorded as it is at assignment time; later changes to
+        its distance do not update earnings or sketches.
+        """
+        if hasattr(ride, 'send'):
+            self.analytics.record_ride(
+                driver.vars.get('driverID'),
+                ride.klass.name,
+                ride.send('fare'),
+                ride.vars.get('distance', 0),
+            )
+    
+    def parse_value(self, value_str, locals_vars):
+        """Convert a literal or variable reference from a script into a value"""
+        if value_str.startswith("'") and value_str.endswith("'"):
+            return value_str[1:-1]
+        elif value_str.replace('.', '', 1).replace('-', '', 1).isdigit():
+            return float(value_str) if '.' in value_str else int(value_str)
+        elif value_str in locals_vars:
+            return locals_vars[value_str]
+        return value_str
+    
     def execute_script(self, code):
         """Execute a Smalltalk script (Main.st)"""
         locals_vars = {}
@@ -280,15 +584,20 @@ class SmalltalkEnvironment:
                         if var_name in locals_vars:
                             Transcript.show(str(locals_vars[var_name]))
                         elif '(' in part:  
-                            obj_match = re.search(r'\((\w+)\s+(\w+)\)', part)
+                            obj_match = re.search(r'\((\w+)\s+([^)]+)\)', part)
                             if obj_match:
                                 obj_name = obj_match.group(1)
-                                method_name = obj_match.group(2)
-                                if obj_name in locals_vars:
-                                    obj = locals_vars[obj_name]
-                                    if hasattr(obj, 'send'):
-                                        result = obj.send(method_name)
-                                        Transcript.show(str(result))
+                                message = obj_match.group(2).strip()
+                                obj = locals_vars.get(obj_name, self.globals.get(obj_name))
+                                if hasattr(obj, 'send'):
+                                    keyword_parts = re.findall(r"(\w+:)\s*('[^']*'|[\w.]+)", message)
+                                    if keyword_parts:
+                                        selector = ''.join(keyword for keyword, _ in keyword_parts)
+                                        send_args = [self.parse_value(value, locals_vars) for _, value in keyword_parts]
+                                        result = obj.send(selector, *send_args)
+                                    else:
+                                        result = obj.send(message)
+                                    Transcript.show(str(result))
                 if '; cr' in line or 'cr.' in line:
                     Transcript.cr()
             
@@ -300,7 +609,7 @@ class SmalltalkEnvironment:
                     
                     if 'new' in value_expr:
                         class_name = value_expr.split()[0]
-                        if class_name in self.classes:
+                        if self.find_class(class_name):
                             locals_vars[var_name] = self.create_instance(class_name)
                     elif value_expr.isdigit():
                         locals_vars[var_name] = int(value_expr)
@@ -313,22 +622,11 @@ class SmalltalkEnvironment:
                         item_names = items_str.replace('with:', '').split()
                         items = [locals_vars.get(name) for name in item_names if name in locals_vars]
                         locals_vars[var_name] = items
-                    elif '+' in value_expr:
-                        parts = value_expr.split('+')
-                        left_var = parts[0].strip()
-                        right_expr = parts[1].strip()
-                        left_val = locals_vars.get(left_var, 0)
-                        
-                        if right_expr in locals_vars:
-                            right_obj = locals_vars[right_expr]
-                            if hasattr(right_obj, 'send'):
-                                right_val = right_obj.send('fare')
-                            else:
-                                right_val = right_obj
-                        else:
-                            right_val = 0
-                        
-                        locals_vars[var_name] = left_val + right_val
+                    else:
+                        node = compile_expression(value_expr)
+                        if not node:
+                            raise SyntaxError(f"Unsupported expression: {value_expr}")
+                        locals_vars[var_name] = self.evaluate(node, None, locals_vars)
             
             elif 'do:' in line:
                 coll_match = re.match(r'(\w+)\s+do:\s*\[\s*:(\w+)\s*\|', line)
@@ -346,20 +644,22 @@ class SmalltalkEnvironment:
                             if action_line == '].':
                                 break
                             
+                            target = node = None
+                            assign_match = re.match(r'(\w+)\s*:=\s*(.+)$', action_line)
+                            if assign_match:
+                                target = assign_match.group(1)
+                                node = compile_expression(assign_match.group(2))
+                                if not node:
+                                    raise SyntaxError(f"Unsupported expression: {assign_match.group(2)}")
+                            
                             for item in collection:
                                 locals_vars[item_var] = item
                                 
                                 if 'rideDetails' in action_line:
                                     if hasattr(item, 'send'):
                                         item.send('rideDetails')
-                                elif ':=' in action_line and '+' in action_line:
-                                    assign_match = re.match(r'(\w+)\s*:=\s*(\w+)\s*\+\s*(\w+)\s+fare', action_line)
-                                    if assign_match:
-                                        target = assign_match.group(1)
-                                        left = assign_match.group(2)
-                                        left_val = locals_vars.get(left, 0)
-                                        right_val = item.send('fare')
-                                        locals_vars[target] = left_val + right_val
+                                elif node:
+                                    locals_vars[target] = self.evaluate(node, None, locals_vars)
             
             elif ' ' in line and ':' not in line:
                 parts = line.rstrip('.').split()
@@ -381,78 +681,63 @@ class SmalltalkEnvironment:
                     if obj_name in locals_vars:
                         obj = locals_vars[obj_name]
                         
-                        if value_str.startswith("'") and value_str.endswith("'"):
-                            value = value_str[1:-1]
-                        elif value_str.replace('.', '', 1).replace('-', '', 1).isdigit():
-                            value = float(value_str) if '.' in value_str else int(value_str)
-                        elif value_str in locals_vars:
-                            value = locals_vars[value_str]
-                        else:
-                            value = value_str
+                        value = self.parse_value(value_str, locals_vars)
                         
                         if hasattr(obj, 'send'):
                             obj.send(selector, value)
 
-print("="*50)
-print("SMALLTALK RIDE SHARING SYSTEM")
-print("="*50)
-print("\nParsing Smalltalk class definitions from .st files...")
-
-env = SmalltalkEnvironment()
+def run_main_program():
+    print("="*50)
+    print("SMALLTALK RIDE SHARING SYSTEM")
+    print("="*50)
+    print("\nParsing Smalltalk class definitions from .st files...")
 
-with open('RideClass.st', 'r') as f:
-    code = f.read()
-    for match in re.finditer(r'(Object|Ride)\s+subclass:\s*\w+\s*\[.*?\n\]', code, re.DOTALL):
-        env.parse_class(match.group(0))
+    env = SmalltalkEnvironment()
 
-print(f"✓ Loaded classes from RideClass.st: {[k for k in env.classes.keys() if k != 'Object']}")
+    env.index_directory('.')
 
-with open('DriverClass.st', 'r') as f:
-    code = f.read()
-    env.parse_class(code)
+    print(f"✓ Indexed classes from .st files: {list(env.class_index)}")
 
-print(f"✓ Loaded Driver class with instance variables: {env.classes['Driver'].instance_vars}")
+    print(f"✓ Loaded Driver class with instance variables: {env.find_class('Driver').instance_vars}")
+    print(f"✓ Loaded Rider class with instance variables: {env.find_class('Rider').instance_vars}")
 
-with open('RiderClass.st', 'r') as f:
-    code = f.read()
-    env.parse_class(code)
+    print("\n--- Demonstrating OOP Principles ---")
+    print("\n1. ENCAPSULATION: Instance variables are private")
+    for class_name in ['Ride', 'Driver', 'Rider']:
+        klass = env.find_class(class_name)
+        if klass:
+            print(f"   {class_name}: {klass.instance_vars}")
 
-print(f"✓ Loaded Rider class with instance variables: {env.classes['Rider'].instance_vars}")
+    print("\n2. INHERITANCE: Class hierarchy")
+    for class_name in ['StandardRide', 'PremiumRide']:
+        klass = env.find_class(class_name)
+        if klass and klass.superclass:
+            print(f"   {class_name} extends {klass.superclass.name}")
 
-print("\n--- Demonstrating OOP Principles ---")
-print("\n1. ENCAPSULATION: Instance variables are private")
-for class_name in ['Ride', 'Driver', 'Rider']:
-    klass = env.classes.get(class_name)
-    if klass:
-        print(f"   {class_name}: {klass.instance_vars}")
+    print("\n3. POLYMORPHISM: Method overriding")
+    for class_name in ['StandardRide', 'PremiumRide']:
+        klass = env.find_class(class_name)
+        if klass:
+            method = klass.find_method('calculateFare')
+            if method:
+                print(f"   {class_name}.calculateFare: {method.body.strip()}")
 
-print("\n2. INHERITANCE: Class hierarchy")
-for class_name in ['StandardRide', 'PremiumRide']:
-    klass = env.classes.get(class_name)
-    if klass and klass.superclass:
-        print(f"   {class_name} extends {klass.superclass.name}")
-
-print("\n3. POLYMORPHISM: Method overriding")
-for class_name in ['StandardRide', 'PremiumRide']:
-    klass = env.classes.get(class_name)
-    if klass:
-        method = klass.find_method('calculateFare')
-        if method:
-            print(f"   {class_name}.calculateFare: {method.body.strip()}")
+    print("\n" + "="*50)
+    print("EXECUTING Main.st SCRIPT")
+    print("="*50 + "\n")
 
-print("\n" + "="*50)
-print("EXECUTING Main.st SCRIPT")
-print("="*50 + "\n")
+    with open('Main.st', 'r') as f:
+        main_code = f.read()
 
-with open('Main.st', 'r') as f:
-    main_code = f.read()
+    env.execute_script(main_code)
 
-env.execute_script(main_code)
+    print("\n" + "="*50)
+    print("OOP PRINCIPLES SUCCESSFULLY DEMONSTRATED")
+    print("="*50)
+    print("\n✓ ENCAPSULATION: Private instance variables accessed via methods")
+    print("✓ INHERITANCE: StandardRide and PremiumRide inherit from Ride")
+    print("✓ POLYMORPHISM: Overridden fare() methods work uniformly in collection")
+    print("\nAll Smalltalk code executed from .st source files!")
 
-print("\n" + "="*50)
-print("OOP PRINCIPLES SUCCESSFULLY DEMONSTRATED")
-print("="*50)
-print("\n✓ ENCAPSULATION: Private instance variables accessed via methods")
-print("✓ INHERITANCE: StandardRide and PremiumRide inherit from Ride")
-print("✓ POLYMORPHISM: Overridden fare() methods work uniformly in collection")
-print("\nAll Smalltalk code executed from .st source files!")
+if __name__ == "__main__":
+    run_main_program()
@@ -4,6 +4,8 @@ import re
 import sys
 from typing import Dict, List, Any, Optional
 
+from fleet_analytics import FleetAnalytics
+
 class SmalltalkObject:
     def __init__(self):
         self.instance_vars = {}
@@ -81,8 +83,9 @@ class PremiumRide(Ride):
         super().rideDetails()
 
 class Driver(SmalltalkObject):
-    def __init__(self):
+    def __init__(self, analytics=None):
         super().__init__()
+        self.analytics = analytics
         self.instance_vars = {
             'driverID': 0,
             'name': '',
@@ -110,6 +113,13 @@ class Driver(SmalltalkObject):
     
     def addRide(self, ride):
         self.instance_vars['assignedRides'].append(ride)
+        if self.analytics:
+            self.analytics.record_ride(
+                self.instance_vars['driverID'],
+                type(ride).__name__,
+                ride.fare(),
+                ride.distance(),
+            )
     
     def getDriverInfo(self):
         print("=== DRIVER INFO ===")
@@ -170,6 +180,8 @@ def run_main_program():
     
     print("--- Creating Rides ---")
     
+    analytics = FleetAnalytics()
+    
     ride1 = StandardRide()
     ride1.rideID_set(101)
     ride1.pickupLocation_set('123 Main St')
@@ -207,7 +219,7 @@ def run_main_program():
     print("Driver class with private assignedRides:")
     print()
     
-    driver1 = Driver()
+    driver1 = Driver(analytics)
     driver1.driverID_set(1001)
     driver1.name_set('John Smith')
     driver1.rating_set(4.8)
@@ -218,7 +230,7 @@ def run_main_program():
     
     print()
     
-    driver2 = Driver()
+    driver2 = Driver(analytics)
     driver2.driverID_set(1002)
     driver2.name_set('Sarah Johnson')
     driver2.rating_set(4.9)
@@ -239,6 +251,13 @@ def run_main_program():
     
     rider1.viewRides()
     
+    print()
+    print("--- FLEET ANALYTICS ---")
+    print(f"Top earners: {analytics.top_earners(2)}")
+    print(f"Rides assigned: {analytics.ride_count()}")
+    print(f"p95 StandardRide fare: ${analytics.fare_quantile(0.95, 'StandardRide')}")
+    print(f"p95 PremiumRide fare: ${analytics.fare_quantile(0.95, 'PremiumRide')}")
+    
     print()
     print("====================================")
     print("INHERITANCE DEMONSTRATION")
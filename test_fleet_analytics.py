@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Checks for the streaming fleet analytics sketches and rankings"""
+
+import json
+import random
+import unittest
+
+from fleet_analytics import FleetAnalytics, QuantileSketch, TopK
+
+class QuantileSketchTest(unittest.TestCase):
+    def test_quantiles_within_relative_accuracy(self):
+        values = [float(i) for i in range(1, 10001)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.01, 0.25, 0.5, 0.9, 0.95, 0.99):
+            exact = values[int(q * len(values)) - 1]
+            estimate = sketch.quantile(q)
+            self.assertLessEqual(abs(estimate - exact) / exact, 0.01, q)
+
+    def test_merge_matches_single_sketch(self):
+        rng = random.Random(7)
+        left = QuantileSketch()
+        right = QuantileSketch()
+        combined = QuantileSketch()
+        for i in range(5000):
+            value = rng.lognormvariate(3, 1)
+            (left if i % 2 else right).add(value)
+            combined.add(value)
+
+        merged = left.merge(right)
+        self.assertEqual(merged.buckets, combined.buckets)
+        self.assertEqual(merged.count, combined.count)
+        self.assertEqual((merged.min, merged.max), (combined.min, combined.max))
+        for q in (0.1, 0.5, 0.95):
+            self.assertEqual(merged.quantile(q), combined.quantile(q))
+
+    def test_zero_values_and_empty_sketch(self):
+        sketch = QuantileSketch()
+        self.assertIsNone(sketch.quantile(0.5))
+        for value in (0, 0, 0, 10):
+            sketch.add(value)
+        self.assertEqual(sketch.quantile(0.5), 0)
+        self.assertEqual(sketch.quantile(1), 10)
+
+class TopKTest(unittest.TestCase):
+    def test_matches_exact_ranking_after_updates_and_evictions(self):
+        rng = random.Random(11)
+        ranking = TopK(k=10)
+        totals = {}
+        for _ in range(20000):
+            key = rng.randrange(300)
+            totals[key] = totals.get(key, 0) + rng.randint(0, 50)
+            ranking.update(key, totals[key])
+
+        expected = sorted(totals.values(), reverse=True)[:10]
+        self.assertEqual([score for _, score in ranking.top()], expected)
+        for key, score in ranking.top():
+            self.assertEqual(totals[key], score)
+        self.assertLessEqual(len(ranking.heap), 2 * ranking.k)
+
+    def test_rejects_empty_ranking(self):
+        with self.assertRaises(ValueError):
+            TopK(k=0)
+        with self.assertRaises(ValueError):
+            FleetAnalytics(k=0)
+
+    def test_ties_between_mixed_key_types(self):
+        ranking = TopK(k=1)
+        ranking.update(None, 10)
+        ranking.update('1001', 10)
+        ranking.update(1001, 10)
+        self.assertEqual(ranking.top(), [(None, 10)])
+
+class FleetAnalyticsTest(unittest.TestCase):
+    def test_json_round_trip_keeps_driver_ids(self):
+        analytics = FleetAnalytics(k=2)
+        analytics.record_ride(1001, 'StandardRide', 10, 5)
+        analytics.record_ride(1002, 'PremiumRide', 35.0, 10)
+
+        restored = FleetAnalytics.from_dict(json.loads(json.dumps(analytics.to_dict())))
+        restored.record_ride(1001, 'StandardRide', 30, 15)
+        self.assertEqual(restored.top_earners(), [(1001, 40), (1002, 35.0)])
+        self.assertEqual(restored.fare_quantile(1, 'PremiumRide'), 35.0)
+
+    def test_merge_combines_workers(self):
+        first = FleetAnalytics()
+        second = FleetAnalytics()
+        first.record_ride(1, 'StandardRide', 10, 5)
+        second.record_ride(1, 'StandardRide', 20, 10)
+        second.record_ride(2, 'PremiumRide', 25, 8)
+
+        merged = first.merge(second)
+        self.assertEqual(merged.top_earners(1), [(1, 30)])
+        self.assertEqual(merged.ride_count(), 3)
+        self.assertEqual(merged.ride_count('StandardRide'), 2)
+
+if __name__ == '__main__':
+    unittest.main()
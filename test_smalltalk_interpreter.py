@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Checks for class loading and expression evaluation in the Smalltalk interpreter"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from smalltalk_interpreter import (
+    OrderedCollection,
+    SmalltalkEnvironment,
+    SmalltalkObject,
+    compile_expression,
+    primitive_send,
+)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def write_sources(directory, sources):
+    for filename, code in sources.items():
+        with open(os.path.join(directory, filename), 'w') as f:
+            f.write(code)
+
+def class_source(superclass_name, class_name):
+    return f"{superclass_name} subclass: {class_name} [\n    name [\n        ^ 1\n    ]\n]\n"
+
+class ClassLoadingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.env = SmalltalkEnvironment()
+
+    def index(self, sources):
+        write_sources(self.tmp.name, sources)
+        self.env.index_directory(self.tmp.name)
+
+    def test_missing_superclass_raises(self):
+        self.index({'orphan.st': class_source('Nope', 'Orphan')})
+        with self.assertRaises(NameError):
+            self.env.find_class('Orphan')
+        with self.assertRaises(NameError):
+            self.env.load_classes(['Orphan'])
+
+    def test_superclass_cycle_raises(self):
+        self.index({'a.st': class_source('B', 'A'), 'b.st': class_source('A', 'B')})
+        with self.assertRaises(NameError):
+            self.env.find_class('A')
+        with self.assertRaises(NameError):
+            self.env.load_classes(['A'])
+
+    def test_class_defined_in_two_files_raises(self):
+        write_sources(self.tmp.name, {
+            'a.st': class_source('Object', 'Twice'),
+            'b.st': class_source('Object', 'Twice'),
+        })
+        with self.assertRaises(NameError):
+            self.env.index_directory(self.tmp.name)
+
+    def test_reindexing_same_directory(self):
+        self.index({'a.st': class_source('Object', 'Once')})
+        self.assertEqual(self.env.index_directory(self.tmp.name), ['Once'])
+
+    def test_lazy_loading_parses_only_referenced_classes(self):
+        self.env.index_directory(PACKAGE_DIR)
+        klass = self.env.find_class('PremiumRide')
+        self.assertEqual(klass.superclass.name, 'Ride')
+        self.assertEqual(set(self.env.classes), {'Object', 'Ride', 'PremiumRide'})
+
+    def test_multi_file_batch_links_superclasses(self):
+        self.index({
+            'base.st': class_source('Object', 'Base'),
+            'middle.st': class_source('Base', 'Middle'),
+            'leaf.st': class_source('Middle', 'Leaf'),
+        })
+        leaf, = self.env.load_classes(['Leaf'], min_parallel_bytes=0)
+        self.assertIs(leaf.superclass, self.env.classes['Middle'])
+        self.assertIs(leaf.superclass.superclass, self.env.classes['Base'])
+        self.assertIs(self.env.classes['Base'].superclass, self.env.classes['Object'])
+        self.assertIsNotNone(leaf.find_method('name'))
+
+class ExpressionTest(unittest.TestCase):
+    def setUp(self):
+        self.env = SmalltalkEnvironment()
+
+    def evaluate(self, expr, **variables):
+        node = compile_expression(expr)
+        self.assertIsNotNone(node, expr)
+        return self.env.evaluate(node, None, variables)
+
+    def test_binary_operators_evaluate_left_to_right(self):
+        self.assertEqual(self.evaluate('2 + 3 * 4'), 20)
+        self.assertEqual(self.evaluate('2 + (3 * 4)'), 14)
+        self.assertEqual(self.evaluate('10 - 2 - 3'), 5)
+
+    def test_unary_binds_tighter_than_binary(self):
+        rides = OrderedCollection([1, 2, 3])
+        self.assertEqual(self.evaluate('1 + rides size * 2', rides=rides), 8)
+        self.assertEqual(self.evaluate('2 * rides size', rides=rides), 6)
+        self.assertEqual(self.evaluate('(3 + 4) printString'), '7')
+
+    def test_max_and_min(self):
+        self.assertEqual(self.evaluate('3 max: 9 - 1'), 8)
+        self.assertEqual(self.evaluate('3 min: 9 - 1'), 3)
+        self.assertEqual(self.evaluate('(1 max: 5) min: 3'), 3)
+
+    def test_literals_are_parsed_at_compile_time(self):
+        self.assertEqual(compile_expression('distance * 3.5'),
+                         ('send', ('var', 'distance'), '*', (('literal', 3.5),)))
+        self.assertEqual(compile_expression('2'), ('literal', 2))
+        self.assertEqual(compile_expression('1e3'), ('literal', 1000))
+        self.assertEqual(compile_expression('1.5e3'), ('literal', 1500.0))
+        self.assertEqual(self.evaluate('5 - -1'), 6)
+        self.assertEqual(self.evaluate('5-1'), 4)
+
+    def test_division_and_comparisons(self):
+        self.assertEqual(self.evaluate('10 / 2'), 5)
+        self.assertIs(type(self.evaluate('10 / 2')), int)
+        self.assertEqual(self.evaluate('10 / 4'), 2.5)
+        self.assertEqual(self.evaluate('(3 <= 2) printString'), 'false')
+        self.assertEqual(self.evaluate('(3 = 3) printString'), 'true')
+
+    def test_unsupported_expression_is_rejected(self):
+        self.assertIsNone(compile_expression("'abc' , 'def'"))
+        self.assertIsNone(compile_expression('(1 + 2'))
+
+    def test_falls_back_to_message_send(self):
+        self.env.index_directory(PACKAGE_DIR)
+        ride = self.env.create_instance('PremiumRide')
+        ride.send('distance:', 10)
+        self.assertEqual(primitive_send(ride, 'fare'), 35.0)
+        self.assertEqual(self.evaluate('ride fare + 1', ride=ride), 36.0)
+        self.assertEqual(primitive_send('abc', 'printString'), 'abc')
+
+class MethodExecutionTest(unittest.TestCase):
+    def setUp(self):
+        self.env = SmalltalkEnvironment()
+        self.env.index_directory(PACKAGE_DIR)
+
+    def test_return_expression_binds_parameters(self):
+        klass = self.env.parse_class(
+            "Object subclass: Meter [\n"
+            "    | rate |\n"
+            "    fareFor: miles [\n"
+            "        ^ miles * 2\n"
+            "    ]\n"
+            "    scaled: miles [\n"
+            "        ^ (miles + rate) * 2\n"
+            "    ]\n"
+            "]"
+        )
+        meter = SmalltalkObject(klass, self.env)
+        meter.vars['rate'] = 1
+        self.assertEqual(meter.send('fareFor:', 4), 8)
+        self.assertEqual(meter.send('scaled:', 4), 10)
+
+    def test_script_totals_fares_in_loop(self):
+        script = (
+            "| ride1 ride2 rides total |\n"
+            "ride1 := StandardRide new.\n"
+            "ride1 distance: 5.\n"
+            "ride2 := PremiumRide new.\n"
+            "ride2 distance: 10.\n"
+            "rides := Array with: ride1 with: ride2.\n"
+            "total := 0.\n"
+            "rides do: [ :ride |\n"
+            "    total := total + ride fare.\n"
+            "].\n"
+            "Transcript show: 'Total: ', total printString; cr.\n"
+        )
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.env.execute_script(script)
+        self.assertEqual(output.getvalue(), 'Total: 45.0\n')
+
+if __name__ == '__main__':
+    unittest.main()